@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from collections.abc import Iterable
+from collections.abc import Sequence
 from functools import partial
 from typing import TYPE_CHECKING, Any
 
@@ -35,7 +35,7 @@ class FakePublisher(PublisherProto):
         self,
         cmd: "PublishCommand",
         *,
-        _extra_middlewares: Iterable["PublisherMiddleware"],
+        _extra_middlewares: Sequence["PublisherMiddleware"] = (),
     ) -> Any:
         """This method should be called in subscriber flow only."""
         cmd = self.patch_command(cmd)
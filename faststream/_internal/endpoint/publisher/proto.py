@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from collections.abc import Iterable
+from collections.abc import Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -33,7 +33,7 @@ class PublisherProto(Protocol[PublishCommandType_contra]):
         self,
         cmd: "PublishCommandType_contra",
         *,
-        _extra_middlewares: Iterable["PublisherMiddleware"],
+        _extra_middlewares: Sequence["PublisherMiddleware"] = (),
     ) -> None:
         """Private method to publish a message.
 
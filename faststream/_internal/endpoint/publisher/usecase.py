@@ -1,6 +1,5 @@
-from collections.abc import Callable, Generator, Iterable
+from collections.abc import Callable, Sequence
 from functools import partial
-from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -21,6 +20,7 @@ from faststream.message.source_type import SourceType
 from .proto import PublisherProto
 
 if TYPE_CHECKING:
+    from faststream._internal.basic_types import AsyncFunc
     from faststream._internal.configs import PublisherUsecaseConfig
     from faststream._internal.producer import ProducerProto
     from faststream._internal.types import (
@@ -44,6 +44,10 @@ class PublisherUsecase(Endpoint, PublisherProto):
 
         self.specification = specification
         self.middlewares = config.middlewares
+        # publisher middlewares are fixed, so reverse them once here
+        self._middlewares_stack: tuple[PublisherMiddleware, ...] = tuple(
+            self.middlewares[::-1]
+        )
 
         self._fake_handler = False
         self.mock = MagicMock()
@@ -81,11 +85,9 @@ class PublisherUsecase(Endpoint, PublisherProto):
         cmd: "PublishCommand",
         *,
         producer: "ProducerProto[Any]",
-        _extra_middlewares: Iterable["PublisherMiddleware"],
+        _extra_middlewares: Sequence["PublisherMiddleware"] = (),
     ) -> Any:
-        pub = producer.publish
-        for pub_m in self._build_middlewares_stack(_extra_middlewares):
-            pub = partial(pub_m, pub)
+        pub = self._wrap_middlewares(producer.publish, _extra_middlewares)
         return await pub(cmd)
 
     async def _basic_publish_batch(
@@ -93,11 +95,9 @@ class PublisherUsecase(Endpoint, PublisherProto):
         cmd: "PublishCommand",
         *,
         producer: "ProducerProto[Any]",
-        _extra_middlewares: Iterable["PublisherMiddleware"],
+        _extra_middlewares: Sequence["PublisherMiddleware"] = (),
     ) -> Any:
-        pub = producer.publish_batch
-        for pub_m in self._build_middlewares_stack(_extra_middlewares):
-            pub = partial(pub_m, pub)
+        pub = self._wrap_middlewares(producer.publish_batch, _extra_middlewares)
         return await pub(cmd)
 
     async def _basic_request(
@@ -106,9 +106,7 @@ class PublisherUsecase(Endpoint, PublisherProto):
         *,
         producer: "ProducerProto[Any]",
     ) -> Any:
-        request = producer.request
-        for pub_m in self._build_middlewares_stack():
-            request = partial(pub_m, request)
+        request = self._wrap_middlewares(producer.request)
 
         published_msg = await request(cmd)
 
@@ -126,22 +124,24 @@ class PublisherUsecase(Endpoint, PublisherProto):
         )
         return response_msg
 
-    def _build_middlewares_stack(
+    def _wrap_middlewares(
         self,
-        extra_middlewares: Iterable["PublisherMiddleware"] = (),
-    ) -> Generator["PublisherMiddleware", None, None]:
-        context = self._outer_config.fd_config.context
-
-        yield from chain(
-            self.middlewares[::-1],
-            (
-                extra_middlewares
-                or (
-                    m(None, context=context).publish_scope
-                    for m in reversed(self._outer_config.broker_middlewares)
-                )
-            ),
-        )
+        call: "AsyncFunc",
+        extra_middlewares: Sequence["PublisherMiddleware"] = (),
+    ) -> "AsyncFunc":
+        for pub_m in self._middlewares_stack:
+            call = partial(pub_m, call)
+
+        if extra_middlewares:
+            for pub_m in extra_middlewares:
+                call = partial(pub_m, call)
+
+        elif broker_middlewares := self._outer_config.broker_middlewares:
+            context = self._outer_config.fd_config.context
+            for m in reversed(broker_middlewares):
+                call = partial(m(None, context=context).publish_scope, call)
+
+        return call
 
     def schema(self) -> dict[str, "PublisherSpec"]:
         return self.specification.get_schema()
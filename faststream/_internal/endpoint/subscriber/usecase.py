@@ -46,6 +46,7 @@ if TYPE_CHECKING:
         BrokerMiddleware,
         CustomCallable,
         Filter,
+        PublisherMiddleware,
         SubscriberMiddleware,
     )
     from faststream.message import StreamMessage
@@ -332,15 +333,20 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
                     if not result_msg.correlation_id:
                         result_msg.correlation_id = message.correlation_id
 
+                    # built lazily: most messages have no publishers to call
+                    publish_middlewares: tuple[PublisherMiddleware, ...] | None = None
                     for p in chain(
                         self.__get_response_publisher(message),
                         h.handler._publishers,
                     ):
+                        if publish_middlewares is None:
+                            publish_middlewares = tuple(
+                                m.publish_scope for m in middlewares[::-1]
+                            )
+
                         await p._publish(
                             result_msg.as_publish_command(),
-                            _extra_middlewares=(
-                                m.publish_scope for m in middlewares[::-1]
-                            ),
+                            _extra_middlewares=publish_middlewares,
                         )
 
                     # Return data for tests
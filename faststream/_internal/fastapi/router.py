@@ -60,7 +60,7 @@ if TYPE_CHECKING:
     from faststream._internal.proto import NameRequired
     from faststream._internal.types import BrokerMiddleware
     from faststream.message import StreamMessage
-    from faststream.specification.base import SpecificationFactory
+    from faststream.specification.base import Specification, SpecificationFactory
     from faststream.specification.schema import Tag, TagDict
 
 
@@ -383,18 +383,38 @@ class StreamRouter(APIRouter, StartAbleApplication, Generic[MsgType]):
         if not self.include_in_schema or not schema_url:
             return None
 
+        cached_specification: Specification | None = None
+
+        def get_specification() -> "Specification":
+            # broker topology is fixed after startup, so build the schema once
+            nonlocal cached_specification
+            if cached_specification is None:
+                cached_specification = self.schema.to_specification()
+            return cached_specification
+
+        cached_json: bytes | None = None
+        cached_yaml: bytes | None = None
+
         def download_app_json_schema() -> Response:
-            return Response(
-                content=json.dumps(
-                    self.schema.to_specification().to_jsonable(),
+            nonlocal cached_json
+            if cached_json is None:
+                cached_json = json.dumps(
+                    get_specification().to_jsonable(),
                     indent=2,
-                ),
+                ).encode()
+
+            return Response(
+                content=cached_json,
                 headers={"Content-Type": "application/octet-stream"},
             )
 
         def download_app_yaml_schema() -> Response:
+            nonlocal cached_yaml
+            if cached_yaml is None:
+                cached_yaml = get_specification().to_yaml().encode()
+
             return Response(
-                content=self.schema.to_specification().to_yaml(),
+                content=cached_yaml,
                 headers={
                     "Content-Type": "application/octet-stream",
                 },
@@ -413,7 +433,7 @@ class StreamRouter(APIRouter, StartAbleApplication, Generic[MsgType]):
             """Serve the AsyncAPI schema as an HTML response."""
             return HTMLResponse(
                 content=get_asyncapi_html(
-                    self.schema.to_specification(),
+                    get_specification(),
                     sidebar=sidebar,
                     info=info,
                     servers=servers,
@@ -25,7 +25,12 @@ class ProducerProto(Protocol[PublishCommandType_contra]):
 
     @abstractmethod
     async def publish_batch(self, cmd: "PublishCommandType_contra") -> Any:
-        """Publishes a messages batch asynchronously."""
+        """Publishes a messages batch asynchronously.
+
+        All messages are taken from `cmd.batch_bodies` and should be sent to the
+        broker as a single batch with one confirmation, not one by one.
+        Producers without native batch support should raise `FeatureNotSupportedException`.
+        """
         ...
 
 
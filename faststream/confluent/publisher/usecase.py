@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Literal, Union, cast, overload
 
 from confluent_kafka import Message
@@ -156,7 +156,7 @@ class DefaultPublisher(LogicPublisher):
         self,
         cmd: Union["PublishCommand", "KafkaPublishCommand"],
         *,
-        _extra_middlewares: Iterable["PublisherMiddleware"],
+        _extra_middlewares: Sequence["PublisherMiddleware"] = (),
     ) -> None:
         """This method should be called in subscriber flow only."""
         cmd = KafkaPublishCommand.from_cmd(cmd)
@@ -236,7 +236,7 @@ class BatchPublisher(LogicPublisher):
         self,
         cmd: Union["PublishCommand", "KafkaPublishCommand"],
         *,
-        _extra_middlewares: Iterable["PublisherMiddleware"],
+        _extra_middlewares: Sequence["PublisherMiddleware"] = (),
     ) -> None:
         """This method should be called in subscriber flow only."""
         cmd = KafkaPublishCommand.from_cmd(cmd, batch=True)
@@ -1,4 +1,4 @@
-from collections.abc import Iterable
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
 from typing_extensions import overload, override
@@ -147,7 +147,7 @@ class LogicPublisher(PublisherUsecase):
         self,
         cmd: Union["PublishCommand", "NatsPublishCommand"],
         *,
-        _extra_middlewares: Iterable["PublisherMiddleware"],
+        _extra_middlewares: Sequence["PublisherMiddleware"] = (),
     ) -> None:
         """This method should be called in subscriber flow only."""
         cmd = NatsPublishCommand.from_cmd(cmd)
@@ -1,4 +1,4 @@
-from collections.abc import Iterable
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 from typing_extensions import Unpack, override
@@ -123,7 +123,7 @@ class RabbitPublisher(PublisherUsecase):
         self,
         cmd: Union["RabbitPublishCommand", "PublishCommand"],
         *,
-        _extra_middlewares: Iterable["PublisherMiddleware"],
+        _extra_middlewares: Sequence["PublisherMiddleware"] = (),
     ) -> None:
         """This method should be called in subscriber flow only."""
         cmd = RabbitPublishCommand.from_cmd(cmd)
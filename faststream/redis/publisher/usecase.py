@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from collections.abc import Iterable
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 from typing_extensions import override
@@ -118,7 +118,7 @@ class ChannelPublisher(LogicPublisher):
         self,
         cmd: Union["PublishCommand", "RedisPublishCommand"],
         *,
-        _extra_middlewares: Iterable["PublisherMiddleware"],
+        _extra_middlewares: Sequence["PublisherMiddleware"] = (),
     ) -> None:
         """This method should be called in subscriber flow only."""
         cmd = RedisPublishCommand.from_cmd(cmd, message_format=self.config.message_format)
@@ -219,7 +219,7 @@ class ListPublisher(LogicPublisher):
         self,
         cmd: Union["PublishCommand", "RedisPublishCommand"],
         *,
-        _extra_middlewares: Iterable["PublisherMiddleware"],
+        _extra_middlewares: Sequence["PublisherMiddleware"] = (),
     ) -> None:
         """This method should be called in subscriber flow only."""
         cmd = RedisPublishCommand.from_cmd(cmd, message_format=self.config.message_format)
@@ -296,7 +296,7 @@ class ListBatchPublisher(ListPublisher):
         self,
         cmd: Union["PublishCommand", "RedisPublishCommand"],
         *,
-        _extra_middlewares: Iterable["PublisherMiddleware"],
+        _extra_middlewares: Sequence["PublisherMiddleware"] = (),
     ) -> None:
         """This method should be called in subscriber flow only."""
         cmd = RedisPublishCommand.from_cmd(
@@ -374,7 +374,7 @@ class StreamPublisher(LogicPublisher):
         self,
         cmd: Union["PublishCommand", "RedisPublishCommand"],
         *,
-        _extra_middlewares: Iterable["PublisherMiddleware"],
+        _extra_middlewares: Sequence["PublisherMiddleware"] = (),
     ) -> None:
         """This method should be called in subscriber flow only."""
         cmd = RedisPublishCommand.from_cmd(cmd, message_format=self.config.message_format)
@@ -1,49 +1,48 @@
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any
 
 
+@lru_cache(maxsize=2048)
 def to_camelcase(*names: str) -> str:
     return " ".join(names).replace("_", " ").title().replace(" ", "")
 
 
 def resolve_payloads(
-    payloads: list[tuple["dict[str, Any]", str]],
+    payloads: Sequence[tuple["dict[str, Any]", str]],
     extra: str = "",
     served_words: int = 1,
 ) -> "dict[str, Any]":
-    ln = len(payloads)
-    payload: dict[str, Any]
-    if ln > 1:
-        one_of_payloads = {}
+    if not payloads:
+        return {}
 
-        for body, handler_name in payloads:
-            title = body["title"]
-            words = title.split(":")
+    if len(payloads) == 1:
+        return payloads[0][0]
+
+    one_of_payloads = {}
 
-            if len(words) > 1:  # not pydantic model case
-                body["title"] = title = ":".join(
-                    filter(
-                        bool,
-                        (
-                            handler_name,
-                            extra if extra not in words else "",
-                            *words[served_words:],
-                        ),
-                    ),
-                )
+    for body, handler_name in payloads:
+        title = body["title"]
 
-            one_of_payloads[title] = body
+        if ":" in title:  # not pydantic model case
+            words = title.split(":")
 
-        payload = {"oneOf": one_of_payloads}
+            parts = [handler_name]
+            if extra and extra not in words:
+                parts.append(extra)
+            parts.extend(words[served_words:])
 
-    elif ln == 1:
-        payload = payloads[0][0]
+            new_title = ":".join([p for p in parts if p])
+            if new_title != title:
+                body = {**body, "title": new_title}
+            title = new_title
 
-    else:
-        payload = {}
+        one_of_payloads[title] = body
 
-    return payload
+    return {"oneOf": one_of_payloads}
 
 
+@lru_cache(maxsize=512)
 def clear_key(key: str) -> str:
     return key.replace("/", ".")
 
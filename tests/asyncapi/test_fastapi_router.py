@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -66,3 +68,27 @@ async def test_fastapi_asyncapi_routes() -> None:
 
             response_html = client.get("/asyncapi_schema")
             assert response_html.status_code == 200
+
+
+@pytest.mark.asyncio()
+async def test_fastapi_asyncapi_schema_cached() -> None:
+    router = NatsRouter(schema_url="/asyncapi_schema")
+
+    @router.subscriber("test")
+    async def handler() -> None: ...
+
+    app = FastAPI()
+    app.include_router(router)
+
+    async with TestNatsBroker(router.broker):
+        with TestClient(app) as client:
+            with patch.object(
+                router.schema,
+                "to_specification",
+                wraps=router.schema.to_specification,
+            ) as to_specification:
+                client.get("/asyncapi_schema.json")
+                client.get("/asyncapi_schema.yaml")
+                client.get("/asyncapi_schema")
+
+            assert to_specification.call_count == 1
@@ -0,0 +1,24 @@
+from faststream.specification.asyncapi.utils import resolve_payloads
+
+
+def test_resolve_payloads_does_not_mutate_shared_body() -> None:
+    body = {"title": "Handler:Message:Payload", "type": "object"}
+
+    payload = resolve_payloads(
+        [(body, "FirstHandler"), (body, "SecondHandler")],
+        "Publisher",
+    )
+
+    assert body["title"] == "Handler:Message:Payload"
+    assert payload == {
+        "oneOf": {
+            "FirstHandler:Publisher:Message:Payload": {
+                "title": "FirstHandler:Publisher:Message:Payload",
+                "type": "object",
+            },
+            "SecondHandler:Publisher:Message:Payload": {
+                "title": "SecondHandler:Publisher:Message:Payload",
+                "type": "object",
+            },
+        },
+    }